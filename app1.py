@@ -1,16 +1,28 @@
+import os # For reading environment variables
+# Must be set before transformers/tokenizers are imported to enable multi-threaded tokenization
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
 import streamlit as st
+import streamlit.components.v1 as components
 import re
-import pyperclip
+import json
+import tempfile
+import threading
+import torch
+import numpy as np
 import spacy
+from spacy.attrs import LOWER, IS_ALPHA, IS_STOP
 from transformers import pipeline
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 from googletrans import Translator
 from googleapiclient.discovery import build
-import os # For reading environment variables
+from googleapiclient.http import build_http
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import traceback # For printing full tracebacks
 
+# Matches watch, youtu.be, shorts and embed URLs; YouTube video IDs are exactly 11 characters
+VIDEO_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([\w-]{11})(?![\w-])")
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="Tubescript Analyzer",
@@ -19,17 +31,43 @@ st.set_page_config(
 )
 
 # --- Initializations ---
-# Load NLP model
+# NLP model (keywords only need lexical attributes, so the neural components are skipped)
 SPACY_MODEL_NAME = "en_core_web_sm"
-try:
-    nlp = spacy.load(SPACY_MODEL_NAME)
-except OSError:
-    st.error(
-        f"SpaCy model '{SPACY_MODEL_NAME}' not found. "
-        f"Please ensure it's downloaded and compatible with your spaCy version "
-        f"(e.g., python -m spacy download {SPACY_MODEL_NAME}==3.6.0 for spaCy v3.6.x)."
-    )
-    st.stop()
+SPACY_UNUSED_COMPONENTS = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+# summarizer (GPU in fp16 when available, otherwise CPU in fp32)
+USE_CUDA = torch.cuda.is_available()
+SUMMARIZER_MODEL_NAME = "sshleifer/distilbart-cnn-12-6"
+# Transcripts shorter than this are shown as-is rather than summarized
+SUMMARY_MIN_CHARS = 600
+SUMMARY_CHUNK_CHARS = 1000
+# Chunks grow to keep long transcripts within MAX_SUMMARY_CHUNKS, but never past what fits
+# in the model's 1024-token input
+SUMMARY_MAX_CHUNK_CHARS = 3500
+MAX_SUMMARY_CHUNKS = 20
+SUMMARY_CACHE_DIR = os.getenv("TUBESCRIPT_SUMMARY_CACHE_DIR", ".tubescript_summaries")
+SUMMARY_CACHE_MAX_ENTRIES = 200
+# Stored with each cached summary; a summary built with different settings is regenerated
+SUMMARY_SETTINGS = {
+    "model": SUMMARIZER_MODEL_NAME,
+    "min_chars": SUMMARY_MIN_CHARS,
+    "chunk_chars": SUMMARY_CHUNK_CHARS,
+    "max_chunk_chars": SUMMARY_MAX_CHUNK_CHARS,
+    "max_chunks": MAX_SUMMARY_CHUNKS,
+    "merge_short_chunks": True,
+}
+
+# translation
+TRANSLATION_MODEL_NAME = "Helsinki-NLP/opus-mt-en-hi"
+# MarianMT inputs are capped at 512 tokens; ~1000 characters stays well inside that
+LOCAL_TRANSLATE_MAX_CHUNK_CHARS = 1000
+# googletrans rejects requests over ~5000 characters
+TRANSLATE_MAX_CHUNK_CHARS = 4500
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Upper bound on waiting for the background video lookup: two API calls, each of which
+# build_http() already limits to a 60 s socket timeout
+VIDEO_DATA_TIMEOUT_SECS = 130
 
 # YouTube API Key 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY_SCRIPT1")
@@ -40,20 +78,113 @@ if not YOUTUBE_API_KEY:
     )
     st.stop()
 
-# summarizer
+# Heavy resources are cached so they are created once per process, not on every rerun
+@st.cache_resource
+def load_nlp():
+    return spacy.load(SPACY_MODEL_NAME, exclude=SPACY_UNUSED_COMPONENTS)
+
+@st.cache_resource
+def load_summarizer():
+    return pipeline(
+        "summarization",
+        model=SUMMARIZER_MODEL_NAME,
+        tokenizer=SUMMARIZER_MODEL_NAME,
+        device=0 if USE_CUDA else -1,
+        torch_dtype=torch.float16 if USE_CUDA else torch.float32,
+    )
+
+@st.cache_resource
+def load_translator():
+    return Translator()
+
+# Local MarianMT model. Load errors are raised rather than returned so st.cache_resource
+# doesn't cache the failure; translate_text() falls back and the next call retries the load.
+@st.cache_resource
+def load_local_translator():
+    return pipeline(
+        "translation_en_to_hi",
+        model=TRANSLATION_MODEL_NAME,
+        device=0 if USE_CUDA else -1,
+        torch_dtype=torch.float16 if USE_CUDA else torch.float32,
+    )
+
+@st.cache_resource
+def youtube_client():
+    # cache_discovery=False skips the file-cache lookup for the discovery document on build
+    return build('youtube', 'v3', developerKey=YOUTUBE_API_KEY, cache_discovery=False)
+
+# Shared pool for blocking network calls so they overlap instead of running back to back
+@st.cache_resource
+def io_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+# Load NLP model
 try:
-    summarizer = pipeline("summarization")
+    nlp = load_nlp()
+except OSError:
+    st.error(
+        f"SpaCy model '{SPACY_MODEL_NAME}' not found. "
+        f"Please ensure it's downloaded and compatible with your spaCy version "
+        f"(e.g., python -m spacy download {SPACY_MODEL_NAME}==3.6.0 for spaCy v3.6.x)."
+    )
+    st.stop()
+
+try:
+    summarizer = load_summarizer()
 except Exception as e:
     st.error(f"Failed to load summarization pipeline: {e}")
     st.info("This might be due to model download issues or transformers/torch compatibility.")
     st.stop()
 
-translator = Translator()
+translator = load_translator()
 
-# user profile
-if "user_profile" not in st.session_state:
-    st.session_state.user_profile = {"name": "Guest", "videos": {}}
-user = st.session_state.user_profile
+# user profile (persisted to disk so saved videos survive restarts)
+PROFILE_PATH = os.getenv("TUBESCRIPT_PROFILE_PATH", "user_profile.json")
+SIDEBAR_VIDEOS_PAGE_SIZE = 10
+
+def load_profile():
+    try:
+        with open(PROFILE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"name": "Guest", "videos": {}}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Could not read user profile from {PROFILE_PATH}, starting a new one: {e}")
+        return {"name": "Guest", "videos": {}}
+
+def write_json_atomic(path, data):
+    # Write to a temp file in the same directory and rename over the original, so a crash
+    # mid-write never leaves a truncated file behind
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def save_profile(profile):
+    """Write the profile to disk; returns False (and logs) instead of raising on failure."""
+    try:
+        write_json_atomic(PROFILE_PATH, profile)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Could not save user profile to {PROFILE_PATH}: {e}")
+        return False
+
+# One profile shared by every session in this process, so sessions never write back stale
+# copies over each other. Mutate it (and write it out) only while holding profile_lock().
+@st.cache_resource
+def profile_store():
+    return load_profile()
+
+@st.cache_resource
+def profile_lock():
+    return threading.Lock()
+
+# The profile (name and saved videos) is shared by everyone using this server
+user = profile_store()
 
 # --- App Title ---
 st.title("📜 Tubescript :Youtube Video Analyzer")
@@ -62,40 +193,264 @@ st.title("📜 Tubescript :Youtube Video Analyzer")
 youtube_url = st.text_input("Enter the YouTube video URL:")
 video_id = None
 if youtube_url:
-    match = re.search(r"v=([\w-]+)", youtube_url)
+    match = VIDEO_ID_RE.search(youtube_url)
     if match:
         video_id = match.group(1)
     else:
         st.warning("Please enter a valid YouTube video URL.")
 
 # --- Helper Functions ---
-def get_related_videos(video_id_to_search):
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_transcript(v_id):
+    return YouTubeTranscriptApi.get_transcript(v_id)
+
+# API errors are raised rather than returned so a failed lookup is never cached
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_video_data(video_id_to_search):
+    # The client is shared across sessions but httplib2 is not thread-safe, so each call
+    # gets its own Http object (build_http applies the client's default socket timeout).
+    # fields= trims the responses to what the app reads.
+    youtube = youtube_client()
+    video_info_response = youtube.videos().list(
+        part='snippet', id=video_id_to_search, fields='items(snippet/title)'
+    ).execute(http=build_http())
+
+    if 'items' not in video_info_response or not video_info_response['items']:
+        return video_info_response, []
+
+    video_title = video_info_response['items'][0]['snippet']['title']
+    search_response = youtube.search().list(
+        part='snippet', type='video', q=video_title, maxResults=5, fields='items(id/videoId,snippet/title)'
+    ).execute(http=build_http())
+    return video_info_response, search_response.get('items', [])
+
+def get_related_videos(video_id_to_search, video_data_future=None):
     if not video_id_to_search:
         return None, []
     try:
-        youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
-        video_info_response = youtube.videos().list(part='snippet', id=video_id_to_search).execute()
-        
+        if video_data_future is not None:
+            video_info_response, related_items = video_data_future.result(timeout=VIDEO_DATA_TIMEOUT_SECS)
+        else:
+            video_info_response, related_items = fetch_video_data(video_id_to_search)
+
         if 'items' not in video_info_response or not video_info_response['items']:
             st.warning(f"Could not retrieve information for video ID: {video_id_to_search}")
             return None, []
 
-        video_title = video_info_response['items'][0]['snippet']['title']
-        search_response = youtube.search().list(
-            part='snippet', type='video', q=video_title, maxResults=5
-        ).execute()
-        return video_info_response, search_response.get('items', [])
+        return video_info_response, related_items
+    except FutureTimeoutError:
+        st.warning("Timed out fetching video details from the YouTube API.")
+        return None, []
     except Exception as e:
         st.error(f"Error fetching video data from YouTube API: {e}")
         return None, []
 
+def count_keywords(docs):
+    """Count alphabetic, non-stop-word tokens (lowercased) across docs, in order of first appearance."""
+    # Filter, dedupe and count on integer LOWER hashes in NumPy instead of looping over Token objects
+    token_attrs = [doc.to_array([LOWER, IS_ALPHA, IS_STOP]) for doc in docs]
+    if not token_attrs:
+        return {}
+    token_attrs = np.concatenate(token_attrs)
+    is_keyword = (token_attrs[:, 1] == 1) & (token_attrs[:, 2] == 0)
+    unique_lowers, first_seen, counts = np.unique(
+        token_attrs[is_keyword, 0], return_index=True, return_counts=True
+    )
+    order = np.argsort(first_seen)
+    return {
+        nlp.vocab.strings[int(lower)]: int(count)
+        for lower, count in zip(unique_lowers[order], counts[order])
+    }
+
+def split_into_chunks(text, max_chars):
+    """Split text into chunks of at most max_chars, breaking on sentence boundaries where possible."""
+    chunks, current = [], ""
+    for sentence in SENTENCE_END_RE.split(text):
+        # Transcripts are often unpunctuated, so hard-wrap any overlong "sentence" on whitespace
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+def merge_short_chunks(chunks, min_chars, max_chars):
+    """Merge chunks shorter than min_chars into a neighbour, as long as the result fits in max_chars."""
+    merged = []
+    for chunk in chunks:
+        if (
+            merged
+            and (len(chunk) < min_chars or len(merged[-1]) < min_chars)
+            and len(merged[-1]) + 1 + len(chunk) <= max_chars
+        ):
+            merged[-1] = f"{merged[-1]} {chunk}"
+        else:
+            merged.append(chunk)
+    return merged
+
+@st.cache_data(show_spinner=False)
+def translate_chunk(chunk, src='en', dest='hi'):
+    return translator.translate(chunk, src=src, dest=dest).text
+
+def translate_text(text, src='en', dest='hi'):
+    local_translator = None
+    if (src, dest) == ('en', 'hi'):
+        try:
+            local_translator = load_local_translator()
+        except Exception as e:
+            print(f"Could not load translation model '{TRANSLATION_MODEL_NAME}', falling back to googletrans: {e}")
+            st.warning("Local translation model unavailable; using Google Translate instead.")
+    if local_translator is not None:
+        chunks = split_into_chunks(text, LOCAL_TRANSLATE_MAX_CHUNK_CHARS)
+        with torch.inference_mode():
+            outputs = local_translator(chunks, batch_size=16, num_beams=4, truncation=True)
+        return " ".join(output['translation_text'] for output in outputs)
+
+    chunks = split_into_chunks(text, TRANSLATE_MAX_CHUNK_CHARS)
+    translated_chunks = io_executor().map(lambda chunk: translate_chunk(chunk, src, dest), chunks)
+    return " ".join(translated_chunks)
+
+# Persisted to disk so revisiting a video skips the transcript fetch and keyword extraction,
+# even across app restarts
+@st.cache_data(persist="disk", max_entries=200, show_spinner=False)
+def analyze_video(v_id):
+    transcript_list = fetch_transcript(v_id)
+    full_text = " ".join(entry['text'] for entry in transcript_list)
+    keyword_counts = {}
+
+    if full_text:
+        # Only the Cython tokenizer is needed, so call it directly rather than via Language.pipe
+        docs = nlp.tokenizer.pipe((entry['text'] for entry in transcript_list), batch_size=64)
+        keyword_counts = count_keywords(docs)
+
+    return {"transcript": full_text, "keyword_counts": keyword_counts}
+
+def summarize_transcript(full_text, preview=None):
+    """Summarize full_text chunk by chunk, rendering the parts into preview as they finish."""
+    if len(full_text) < SUMMARY_MIN_CHARS:
+        return [full_text]
+
+    chunk_size = min(max(SUMMARY_CHUNK_CHARS, len(full_text) // MAX_SUMMARY_CHUNKS + 1), SUMMARY_MAX_CHUNK_CHARS)
+    chunks = split_into_chunks(full_text, chunk_size)
+    # Packing whole sentences leaves chunks short of chunk_size, so grow it until the real
+    # chunk count fits (or the model's input limit is reached)
+    while len(chunks) > MAX_SUMMARY_CHUNKS and chunk_size < SUMMARY_MAX_CHUNK_CHARS:
+        chunk_size = min(chunk_size * 5 // 4, SUMMARY_MAX_CHUNK_CHARS)
+        chunks = split_into_chunks(full_text, chunk_size)
+    # Sentence packing and hard wraps can leave fragments of a few words; with min_length=30 the
+    # model would pad those out with invented text, so fold them into a neighbouring chunk and
+    # pass through unsummarized any that still can't be merged
+    chunks = merge_short_chunks(chunks, SUMMARY_MIN_CHARS, SUMMARY_MAX_CHUNK_CHARS)
+    summarized_text_parts = []
+    with torch.inference_mode():
+        # Feeding a generator makes the pipeline yield each summary as soon as its batch is done
+        summary_outputs = summarizer(
+            (chunk for chunk in chunks if len(chunk) >= SUMMARY_MIN_CHARS),
+            batch_size=8, truncation=True, max_length=150, min_length=30, do_sample=False
+        )
+        for chunk in chunks:
+            if len(chunk) < SUMMARY_MIN_CHARS:
+                summarized_text_parts.append(chunk)
+            else:
+                summarized_text_parts.append(next(summary_outputs)[0]['summary_text'])
+            if preview is not None:
+                preview.markdown(
+                    "\n\n".join(f"**Part {i + 1}:** {part}" for i, part in enumerate(summarized_text_parts))
+                )
+    return summarized_text_parts
+
+# Summaries are stored as plain JSON per video rather than through st.cache_data, because they
+# are streamed into the page while being generated and st.cache_data would record and replay
+# every intermediate frame
+def summary_cache_path(v_id):
+    return os.path.join(SUMMARY_CACHE_DIR, f"{v_id}.json")
+
+def load_cached_summary(v_id):
+    path = summary_cache_path(v_id)
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Could not read cached summary for {v_id}: {e}")
+        return None
+    # Summaries built with a different model or chunking settings are stale
+    if cached.get("settings") != SUMMARY_SETTINGS:
+        return None
+    try:
+        # Bump the mtime so pruning evicts the least recently used summaries first
+        os.utime(path)
+    except OSError:
+        pass
+    return cached.get("summary")
+
+def prune_summary_cache():
+    """Delete the least recently used summaries beyond SUMMARY_CACHE_MAX_ENTRIES."""
+    with os.scandir(SUMMARY_CACHE_DIR) as entries:
+        cached_files = [entry for entry in entries if entry.name.endswith(".json")]
+    if len(cached_files) <= SUMMARY_CACHE_MAX_ENTRIES:
+        return
+    cached_files.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in cached_files[:len(cached_files) - SUMMARY_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+def save_cached_summary(v_id, summaries):
+    try:
+        os.makedirs(SUMMARY_CACHE_DIR, exist_ok=True)
+        write_json_atomic(summary_cache_path(v_id), {"settings": SUMMARY_SETTINGS, "summary": summaries})
+        prune_summary_cache()
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Could not cache summary for {v_id}: {e}")
+
+def copy_to_clipboard_button(text, label):
+    # Copies in the browser; the server has no clipboard on a headless deployment
+    js_text = json.dumps(text).replace("</", "<\\/")
+    components.html(
+        f"""
+        <button id="copy-btn" style="padding: 0.4rem 0.8rem; cursor: pointer;">{label}</button>
+        <span id="copy-status" style="margin-left: 0.5rem; font-family: sans-serif;"></span>
+        <script>
+        const text = {js_text};
+        document.getElementById("copy-btn").addEventListener("click", () => {{
+            navigator.clipboard.writeText(text).then(
+                () => {{ document.getElementById("copy-status").textContent = "Copied to clipboard."; }},
+                () => {{ document.getElementById("copy-status").textContent = "Could not access the clipboard."; }}
+            );
+        }});
+        </script>
+        """,
+        height=50,
+    )
+
 def save_video_to_profile(v_id, title, summaries):
-    user["videos"][v_id] = {"title": title, "summarized_text": summaries}
-    st.session_state.user_profile = user
+    """Save the video to the profile; returns True if it was new or changed."""
+    entry = {"title": title, "summarized_text": summaries}
+    with profile_lock():
+        # This runs on every rerun of a loaded video, so skip the disk write if nothing changed
+        if user["videos"].get(v_id) == entry:
+            return False
+        user["videos"][v_id] = entry
+        if not save_profile(user):
+            st.warning("Video could not be saved to disk; it will be lost when the app restarts.")
+    return True
 
 # --- Processing ---
 if video_id:
-    st.video(youtube_url)
+    st.video(f"https://www.youtube.com/watch?v={video_id}")
     st.write(f"Video ID: {video_id}")
 
     # Use a spinner to show the app is working
@@ -103,30 +458,32 @@ if video_id:
         full_text = None
         summarized_text_parts = []
         try:
-            st.info(f"Fetching transcript...")
-            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-            full_text = " ".join([entry['text'] for entry in transcript_list])
-            
+            # Video details and related videos are fetched in the background while the
+            # transcript is downloaded and analyzed
+            video_data_future = io_executor().submit(fetch_video_data, video_id)
+
+            st.info(f"Fetching transcript and extracting keywords...")
+            analysis = analyze_video(video_id)
+            full_text = analysis["transcript"]
+            keyword_counts = analysis["keyword_counts"]
+            keywords = list(keyword_counts)
+
             # If transcript is fetched, proceed with analysis
             if full_text:
-                st.info("Summarizing transcript...")
-                max_chunk_size = 1000
-                for i in range(0, len(full_text), max_chunk_size):
-                    chunk = full_text[i:i + max_chunk_size]
-                    summary_output = summarizer(chunk, max_length=150, min_length=30, do_sample=False)
-                    if summary_output:
-                        summarized_text_parts.append(summary_output[0]['summary_text'])
-                
-                st.info("Extracting keywords...")
-                doc = nlp(full_text)
-                keywords = list(set([token.text for token in doc if token.is_alpha and not token.is_stop]))
+                summarized_text_parts = load_cached_summary(video_id)
+                if summarized_text_parts is None:
+                    st.info("Summarizing transcript...")
+                    summary_preview = st.empty()
+                    summarized_text_parts = summarize_transcript(full_text, summary_preview)
+                    summary_preview.empty()
+                    save_cached_summary(video_id, summarized_text_parts)
 
                 st.info("Fetching video details and related videos...")
-                video_info_data, related_videos_data = get_related_videos(video_id)
+                video_info_data, related_videos_data = get_related_videos(video_id, video_data_future)
                 if video_info_data and 'items' in video_info_data:
                     current_video_title = video_info_data['items'][0]['snippet']['title']
-                    save_video_to_profile(video_id, current_video_title, summarized_text_parts)
-                    st.success(f"Video '{current_video_title}' saved to your profile!")
+                    if save_video_to_profile(video_id, current_video_title, summarized_text_parts):
+                        st.success(f"Video '{current_video_title}' saved to your profile!")
 
         except TranscriptsDisabled:
             st.error(f"Transcripts are disabled for video ID: {video_id}")
@@ -153,9 +510,7 @@ if video_id:
             if summarized_text_parts:
                 for i, summary_part in enumerate(summarized_text_parts):
                     st.write(f"**Part {i + 1}:** {summary_part}")
-                if st.button("Copy Summarized Text to Clipboard"):
-                    pyperclip.copy("\n".join(summarized_text_parts))
-                    st.info("Summarized text copied to clipboard.")
+                copy_to_clipboard_button("\n".join(summarized_text_parts), "Copy Summarized Text to Clipboard")
             else:
                 st.write("No summary could be generated.")
 
@@ -170,11 +525,9 @@ if video_id:
             st.header("Word Cloud for Keywords")
             if keywords:
                 try:
-                    wordcloud_obj = WordCloud(width=800, height=400, background_color="white").generate(" ".join(keywords))
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.imshow(wordcloud_obj, interpolation="bilinear")
-                    ax.axis("off")
-                    st.pyplot(fig)
+                    wordcloud_obj = WordCloud(width=800, height=400, background_color="white").generate_from_frequencies(keyword_counts)
+                    # WordCloud already renders to an RGB array, so skip building a matplotlib figure
+                    st.image(wordcloud_obj.to_array(), use_container_width=True)
                 except Exception as e_wc:
                     st.error(f"Could not generate word cloud: {e_wc}")
             else:
@@ -185,7 +538,7 @@ if video_id:
             if st.button("Translate to Hindi"):
                 st.info("Translating...")
                 try:
-                    translated_text = translator.translate(full_text, src='en', dest='hi').text
+                    translated_text = translate_text(full_text, src='en', dest='hi')
                     st.write(translated_text)
                     st.success("Translation complete.")
                 except Exception as e_translate:
@@ -211,17 +564,25 @@ if video_id:
 
 # Sidebar
 st.sidebar.title("👤 User Profile")
+st.sidebar.caption("This profile and its saved videos are shared by everyone using this server.")
 st.sidebar.subheader(f"Welcome, {user['name']}!")
 new_name = st.sidebar.text_input("Update Name:", user["name"], key="user_name_input")
 if st.sidebar.button("Update Profile Name"):
-    user["name"] = new_name
-    st.session_state.user_profile = user
+    with profile_lock():
+        if user["name"] != new_name:
+            user["name"] = new_name
+            save_profile(user)
     st.sidebar.success("Profile name updated!")
     st.rerun()
 
-st.sidebar.subheader("🗂️ Your Saved Videos")
-if user["videos"]:
-    for vid_id_key, data_val in user["videos"].items():
+st.sidebar.subheader("🗂️ Saved Videos")
+with profile_lock():
+    saved_videos = list(user["videos"].items())[::-1]
+if saved_videos:
+    # Only render the most recent videos; older ones are loaded a page at a time on request
+    if "sidebar_videos_shown" not in st.session_state:
+        st.session_state.sidebar_videos_shown = SIDEBAR_VIDEOS_PAGE_SIZE
+    for vid_id_key, data_val in saved_videos[:st.session_state.sidebar_videos_shown]:
         with st.sidebar.expander(f"{data_val['title']}"):
             st.markdown(f"**Summarized Parts:**")
             if data_val["summarized_text"]:
@@ -229,5 +590,9 @@ if user["videos"]:
                     st.write(f"Part {s_idx + 1}: {s_text}")
             else:
                 st.write("No summary available for this video.")
+    if len(saved_videos) > st.session_state.sidebar_videos_shown:
+        if st.sidebar.button("Show more saved videos"):
+            st.session_state.sidebar_videos_shown += SIDEBAR_VIDEOS_PAGE_SIZE
+            st.rerun()
 else:
-    st.sidebar.info("You have not saved any videos yet.")
\ No newline at end of file
+    st.sidebar.info("No videos have been saved yet.")
\ No newline at end of file